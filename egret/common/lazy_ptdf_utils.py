@@ -24,6 +24,15 @@ class LazyPTDFTerminationCondition(Enum):
     FLOW_VIOLATION = 3
 
 def populate_default_ptdf_options(ptdf_options):
+    '''
+    returns a copy of ptdf_options (which may be None) with
+    defaults filled in, so the caller's dictionary is not
+    modified by the defaults or by later scaling
+    '''
+    if ptdf_options is None:
+        ptdf_options = dict()
+    else:
+        ptdf_options = dict(ptdf_options)
     if 'rel_ptdf_tol' not in ptdf_options:
         ptdf_options['rel_ptdf_tol'] = 1.e-6
     if 'abs_ptdf_tol' not in ptdf_options:
@@ -44,6 +53,7 @@ def populate_default_ptdf_options(ptdf_options):
         ptdf_options['load_from'] = None
     if 'save_to' not in ptdf_options:
         ptdf_options['save_to'] = None
+    return ptdf_options
 
 def check_and_scale_ptdf_options(ptdf_options, baseMVA):
     ## scale to base MVA
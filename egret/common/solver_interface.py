@@ -13,6 +13,13 @@ This file includes the solver interfaces for EGRET.
 import pyomo.opt as po
 from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
 
+## the names each solver uses for the (mipgap, timelimit) options
+_solver_option_names = {
+                        'gurobi' : ('MIPGap', 'TimeLimit'),
+                        'cplex'  : ('mip_tolerances_mipgap', 'timelimit'),
+                        'glpk'   : ('mipgap', 'tmlim'),
+                        'cbc'    : ('ratioGap', 'sec'),
+                       }
 
 def _set_options(solver, mipgap=None, timelimit=None, other_options=None):
     '''
@@ -40,26 +47,13 @@ def _set_options(solver, mipgap=None, timelimit=None, other_options=None):
 
     solver_name = solver.name
 
-    if 'gurobi' in solver_name:
-        if mipgap is not None:
-            solver.options.MIPGap = mipgap
-        if timelimit is not None:
-            solver.options.TimeLimit = timelimit
-    elif 'cplex' in solver_name:
-        if mipgap is not None:
-            solver.options.mip_tolerances_mipgap = mipgap
-        if timelimit is not None:
-            solver.options.timelimit = timelimit
-    elif 'glpk' in solver_name:
-        if mipgap is not None:
-            solver.options.mipgap = mipgap
-        if timelimit is not None:
-            solver.options.tmlim = timelimit
-    elif 'cbc' in solver_name:
-        if mipgap is not None:
-            solver.options.ratioGap = mipgap
-        if timelimit is not None:
-            solver.options.sec = timelimit
+    for name, (mipgap_option, timelimit_option) in _solver_option_names.items():
+        if name in solver_name:
+            if mipgap is not None:
+                solver.options[mipgap_option] = mipgap
+            if timelimit is not None:
+                solver.options[timelimit_option] = timelimit
+            break
     # else:
     #     raise Exception('Solver {0} not recognized'.format(solver_name))
 
@@ -19,26 +19,40 @@ import egret.model_library.transmission.tx_calc as tx_calc
 from egret.model_library.defn import BasePointType, ApproximationType
 from math import radians
 
-def get_ptdf_potentially_from_file(ptdf_options, branches_keys, buses_keys):
+def load_ptdf_pickle_potentially(ptdf_options):
     '''
-    small loop to get a PTDF matrix previously pickled, 
-    returns None if not found
+    unpickle ptdf_options['load_from'], if given,
+    returns None if not given or if loading fails
     '''
-
-    PTDF = None
     PTDF_pickle = None
     if ptdf_options['load_from'] is not None:
+        ## a stale or foreign pickle can fail in many ways (missing file,
+        ## truncated data, classes that no longer import), but let
+        ## KeyboardInterrupt and SystemExit through
         try:
-            PTDF_pickle = pickle.load(open(ptdf_options['load_from'], 'rb'))
-        except:
+            with open(ptdf_options['load_from'], 'rb') as f:
+                PTDF_pickle = pickle.load(f)
+        except Exception:
             print("Error loading PTDF matrix from pickle file, calculating from start")
+    return PTDF_pickle
 
+def get_ptdf_from_pickle(PTDF_pickle, branches_keys, buses_keys):
+    '''
+    small loop to find a PTDF matrix consistent with branches_keys
+    and buses_keys in an unpickled object, returns None if not found
+    '''
+    PTDF = None
     if PTDF_pickle is not None:
         ## This may be a dict of data_utils.PTDFMatrix objects or just an object
         if isinstance(PTDF_pickle, dict):
+            ## build the key sets once, and stop at the first
+            ## consistent matrix rather than scanning every entry
+            branches_keys = set(branches_keys)
+            buses_keys = set(buses_keys)
             for key, PTDFo in PTDF_pickle.items():
                 if _is_consistent_ptdfm(PTDFo, branches_keys, buses_keys):
                     PTDF = PTDFo
+                    break
         ## could be a single ptdf dict
         else:
             if _is_consistent_ptdfm(PTDF_pickle, branches_keys, buses_keys):
@@ -46,9 +60,18 @@ def get_ptdf_potentially_from_file(ptdf_options, branches_keys, buses_keys):
 
     return PTDF
 
+def get_ptdf_potentially_from_file(ptdf_options, branches_keys, buses_keys):
+    '''
+    small loop to get a PTDF matrix previously pickled, 
+    returns None if not found
+    '''
+    PTDF_pickle = load_ptdf_pickle_potentially(ptdf_options)
+    return get_ptdf_from_pickle(PTDF_pickle, branches_keys, buses_keys)
+
 def write_ptdf_potentially_to_file(ptdf_options, PTDF):
     if ptdf_options['save_to'] is not None:
-        pickle.dump(PTDF, open(ptdf_options['save_to'], 'wb'))
+        with open(ptdf_options['save_to'], 'wb') as f:
+            pickle.dump(PTDF, f)
 
 def _is_consistent_ptdfm(ptdf_mat, branches_keys, buses_keys):
     '''
@@ -68,8 +91,12 @@ def _is_consistent_ptdfm(ptdf_mat, branches_keys, buses_keys):
            with those in the object ptdf_mat
 
     '''
-    return ( set(branches_keys) == set(ptdf_mat.branches_keys) and \
-             set(buses_keys) == set(ptdf_mat.buses_keys) )
+    if not isinstance(branches_keys, set):
+        branches_keys = set(branches_keys)
+    if not isinstance(buses_keys, set):
+        buses_keys = set(buses_keys)
+    return ( branches_keys == set(ptdf_mat.branches_keys) and \
+             buses_keys == set(ptdf_mat.buses_keys) )
 
 class PTDFMatrix(object):
     '''
@@ -163,7 +190,10 @@ class PTDFMatrix(object):
         row_idx = self._branchname_to_index_map[branch_name]
         ## get the row slice
         PTDF_row = self.PTDFM[row_idx]
-        return np.abs(PTDF_row).max()
+        ## the largest magnitude is either the largest
+        ## or the negated smallest entry, so no absolute
+        ## value of the row needs to be built
+        return max(PTDF_row.max(), -PTDF_row.min())
 
     def get_branch_phase_shift(self, branch_name):
         return self.phase_shift_array[self._branchname_to_index_map[branch_name]]
@@ -257,8 +287,8 @@ class PTDFLossesMatrix(PTDFMatrix):
     def get_branch_ldf_abs_max(self, branch_name):
         row_idx = self._branchname_to_index_map[branch_name]
         ## get the row slice
-        losses_row = self.LDF[row_idx]
-        return np.abs(losses_row).max()
+        LDF_row = self.LDF[row_idx]
+        return max(LDF_row.max(), -LDF_row.min())
 
     def get_branch_ldf_c(self, branch_name):
         return self.LDF_C[self._branchname_to_index_map[branch_name]]
@@ -287,15 +287,9 @@ class ModelData(object):
         -------
             ModelData
         """
-        # clone the data object, and then replace the time_series as needed
-        gd = self.clone()
-
-        # loop over all the elements
-        for e in gd.data['elements'].values():
-            # loop over all the element main-level attributes
-            self._replace_timeseries_with_value(e, timestamp)
-
-        return gd
+        # copy the data object, replacing the time_series as we go so that
+        # the full time series are never copied only to be discarded
+        return ModelData(_copy_at_timestamp(self.data, timestamp))
 
     def read_from_json(self, filename):
         """
@@ -324,22 +318,10 @@ class ModelData(object):
         """
         import json
 
+        ## json.dumps uses the C encoder, whereas
+        ## json.dump always encodes in pure python
         with open(filename + '.json','w') as f:
-            json.dump(self.data, f)
-
-    def _replace_timeseries_with_value(self, node, timestamp):
-        # loop over the attributes on this dict
-        for key, att in node.items():
-            # ignore if the attribute is not a dict
-            # TODO: Should we recurse through lists (are they allowed in the data_dict)?
-            if isinstance(att, dict):
-                if 'data_type' in att and att["data_type"] == "time_series":
-                    # the attribute is itself a dict and is a time_series specification
-                    # so replace the time_series with the appropriate value
-                    node[key] = att["values"][timestamp]
-                else:
-                    # recurse further down the tree
-                    self._replace_timeseries_with_value(att, timestamp)
+            f.write(json.dumps(self.data))
 
 
 # TODO: These should be moved to a more general "model utilities" module
@@ -369,3 +351,32 @@ def _copy_only_in_service(data_dict):
             new_dd[key] = cp.deepcopy(value)
     return new_dd
 
+def _copy_at_timestamp(data_dict, timestamp):
+    new_dd = dict()
+    for key, value in data_dict.items():
+        if key == 'elements':
+            ## value is the elements dictionary
+            new_dd[key] = dict()
+            new_elements = new_dd[key]
+            for elements_name, elements in value.items():
+                new_elements[elements_name] = _copy_node_at_timestamp(elements, timestamp)
+        else:
+            new_dd[key] = cp.deepcopy(value)
+    return new_dd
+
+def _copy_node_at_timestamp(node, timestamp):
+    new_node = dict()
+    # loop over the attributes on this dict
+    for key, att in node.items():
+        # TODO: Should we recurse through lists (are they allowed in the data_dict)?
+        if isinstance(att, dict):
+            if 'data_type' in att and att["data_type"] == "time_series":
+                # the attribute is itself a dict and is a time_series specification
+                # so copy only the value at the appropriate timestamp
+                new_node[key] = cp.deepcopy(att["values"][timestamp])
+            else:
+                # recurse further down the tree
+                new_node[key] = _copy_node_at_timestamp(att, timestamp)
+        else:
+            new_node[key] = cp.deepcopy(att)
+    return new_node
@@ -0,0 +1,50 @@
+#  ___________________________________________________________________________
+#
+#  EGRET: Electrical Grid Research and Engineering Tools
+#  Copyright 2019 National Technology & Engineering Solutions of Sandia, LLC
+#  (NTESS). Under the terms of Contract DE-NA0003525 with NTESS, the U.S.
+#  Government retains certain rights in this software.
+#  This software is distributed under the Revised BSD License.
+#  ___________________________________________________________________________
+
+import pickle
+from types import SimpleNamespace
+
+import egret.data.data_utils as data_utils
+
+def _write_ptdf_pickle(file_name, ptdf):
+    with open(file_name, 'wb') as f:
+        pickle.dump(ptdf, f)
+
+def test_get_ptdf_potentially_from_file(tmpdir):
+    file_name = str(tmpdir.join('ptdf.pickle'))
+    ptdf_options = {'load_from' : file_name}
+
+    ptdf = SimpleNamespace(branches_keys=('l1','l2'), buses_keys=('b1','b2'))
+    _write_ptdf_pickle(file_name, ptdf)
+
+    PTDF = data_utils.get_ptdf_potentially_from_file(ptdf_options, ['l2','l1'], ['b1','b2'])
+    assert PTDF.branches_keys == ('l1','l2')
+
+    assert data_utils.get_ptdf_potentially_from_file(ptdf_options, ['l1'], ['b1','b2']) is None
+    assert data_utils.get_ptdf_potentially_from_file({'load_from' : None}, ['l1','l2'], ['b1','b2']) is None
+    assert data_utils.get_ptdf_potentially_from_file({'load_from' : str(tmpdir.join('missing.pickle'))},
+                                                     ['l1','l2'], ['b1','b2']) is None
+
+def test_get_ptdf_from_pickle_dict(tmpdir):
+    file_name = str(tmpdir.join('ptdfs.pickle'))
+
+    ptdf_all = SimpleNamespace(branches_keys=('l1','l2'), buses_keys=('b1','b2'))
+    ptdf_l1 = SimpleNamespace(branches_keys=('l1',), buses_keys=('b1','b2'))
+    _write_ptdf_pickle(file_name, {() : ptdf_all, ('l2',) : ptdf_l1})
+
+    ## unpickle once, then look up each set of branches in service
+    PTDF_pickle = data_utils.load_ptdf_pickle_potentially({'load_from' : file_name})
+
+    PTDF = data_utils.get_ptdf_from_pickle(PTDF_pickle, ['l1','l2'], ['b1','b2'])
+    assert PTDF is PTDF_pickle[()]
+    PTDF = data_utils.get_ptdf_from_pickle(PTDF_pickle, ['l1'], ['b1','b2'])
+    assert PTDF is PTDF_pickle[('l2',)]
+    assert data_utils.get_ptdf_from_pickle(PTDF_pickle, ['l2'], ['b1','b2']) is None
+
+    assert data_utils.get_ptdf_from_pickle(None, ['l1'], ['b1','b2']) is None
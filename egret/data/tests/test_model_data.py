@@ -173,3 +173,27 @@ def test_clone_at_timestamp():
     comparison_md.data['elements']['load']['L1']['Pl'] = 111.1
 
     assert cloned_md.data == comparison_md.data
+
+def test_clone_at_timestamp_leaves_original():
+    md = ModelData(testdata)
+    cloned_md = md.clone_at_timestamp(1.0)
+
+    assert cloned_md.data['elements']['load']['L1']['Pl'] == 111.0
+    assert md.data['elements']['load']['L1']['Pl']['values'] == {0.0: 11.0, 1.0: 111.0, 2.0: 111.1}
+
+    cloned_md.data['system']['reference_bus'] = 'B2'
+    assert md.data['system']['reference_bus'] == 'B1'
+
+def test_json_read_write(tmpdir):
+    md = ModelData(testdata)
+    filename = str(tmpdir.join('testdata'))
+    md.write_to_json(filename)
+
+    md_read = ModelData()
+    md_read.read_from_json(filename + '.json')
+
+    ## json keys are always strings
+    comparison_md = md.clone()
+    comparison_md.data['elements']['load']['L1']['Pl']['values'] = {'0.0': 11.0, '1.0': 111.0, '2.0': 111.1}
+
+    assert md_read.data == comparison_md.data
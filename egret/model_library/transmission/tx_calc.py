@@ -463,6 +463,37 @@ def calculate_phi_loss_constant(branches,index_set_branch,index_set_bus,approxim
     return phi_loss_from.tocsr(), phi_loss_to.tocsr()
 
 
+def _calculate_branch_base_point(branches,buses,index_set_branch,base_point=BasePointType.FLATSTART):
+    """
+    Collect the branch parameters and from/to bus voltages at the base point
+    as arrays ordered by index_set_branch, for the vectorized calculations below
+    """
+    _len_branch = len(index_set_branch)
+    branch_list = [branches[branch_name] for branch_name in index_set_branch]
+
+    tau = np.fromiter((branch['transformer_tap_ratio'] if branch['branch_type'] == 'transformer' else 1.
+                        for branch in branch_list), float, count=_len_branch)
+    shift = np.fromiter((math.radians(branch['transformer_phase_shift']) if branch['branch_type'] == 'transformer' else 0.
+                          for branch in branch_list), float, count=_len_branch)
+    g = np.fromiter((calculate_conductance(branch) for branch in branch_list), float, count=_len_branch)
+    b = np.fromiter((calculate_susceptance(branch) for branch in branch_list), float, count=_len_branch)
+
+    if base_point == BasePointType.FLATSTART:
+        vn = np.ones(_len_branch)
+        vm = np.ones(_len_branch)
+        tn = np.zeros(_len_branch)
+        tm = np.zeros(_len_branch)
+    elif base_point == BasePointType.SOLUTION: # TODO: check that we are loading the correct values (or results)
+        vn = np.fromiter((buses[branch['from_bus']]['vm'] for branch in branch_list), float, count=_len_branch)
+        vm = np.fromiter((buses[branch['to_bus']]['vm'] for branch in branch_list), float, count=_len_branch)
+        tn = np.fromiter((buses[branch['from_bus']]['va'] for branch in branch_list), float, count=_len_branch)
+        tm = np.fromiter((buses[branch['to_bus']]['va'] for branch in branch_list), float, count=_len_branch)
+    else:
+        raise Exception("Unrecognized base_point {}".format(base_point))
+
+    return tau, shift, g, b, vn, vm, tn, tm
+
+
 def _calculate_pf_constant(branches,buses,index_set_branch,base_point=BasePointType.FLATSTART):
     """
     Compute the power flow constant for the taylor series expansion of real power flow as
@@ -470,36 +501,12 @@ def _calculate_pf_constant(branches,buses,index_set_branch,base_point=BasePointT
     pf = 0.5*g*((tau*vn)^2 - vm^2) - tau*vn*vm*b*sin(tn-tm-shift)
     """
 
-    _len_branch = len(index_set_branch)
-    ## this will be fully dense
-    pf_constant = np.zeros(_len_branch)
-
-    for idx_row, branch_name in enumerate(index_set_branch):
-        branch = branches[branch_name]
-        from_bus = branch['from_bus']
-        to_bus = branch['to_bus']
-
-        tau = 1.0
-        shift = 0.0
-        if branch['branch_type'] == 'transformer':
-            tau = branch['transformer_tap_ratio']
-            shift = math.radians(branch['transformer_phase_shift'])
-        g = calculate_conductance(branch)
-        b = calculate_susceptance(branch)/tau
-
-        if base_point == BasePointType.FLATSTART:
-            vn = 1.
-            vm = 1.
-            tn = 0.
-            tm = 0.
-        elif base_point == BasePointType.SOLUTION: # TODO: check that we are loading the correct values (or results)
-            vn = buses[from_bus]['vm']
-            vm = buses[to_bus]['vm']
-            tn = buses[from_bus]['va']
-            tm = buses[to_bus]['va']
+    tau, shift, g, b, vn, vm, tn, tm = _calculate_branch_base_point(branches,buses,index_set_branch,base_point)
+    b = b/tau
 
-        pf_constant[idx_row] = 0.5 * g * ((vn/tau) ** 2 - vm ** 2) \
-                               - b * vn * vm * (sin(tn - tm + shift) - cos(tn - tm + shift)*(tn - tm))
+    ## this will be fully dense
+    pf_constant = 0.5 * g * ((vn/tau) ** 2 - vm ** 2) \
+                  - b * vn * vm * (np.sin(tn - tm + shift) - np.cos(tn - tm + shift)*(tn - tm))
 
     return pf_constant
 
@@ -511,38 +518,13 @@ def _calculate_pfl_constant(branches,buses,index_set_branch,base_point=BasePoint
     pfl = g*((tau*vn)^2 + vm^2) - 2*tau*vn*vm*g*cos(tn-tm-shift)
     """
 
-    _len_branch = len(index_set_branch)
+    tau, shift, _g, _, vn, vm, tn, tm = _calculate_branch_base_point(branches,buses,index_set_branch,base_point)
+    g = _g/tau
+    g2 = _g/tau**2
 
     ## this will be fully dense
-    pfl_constant = np.zeros(_len_branch)
-
-    for idx_row, branch_name in enumerate(index_set_branch):
-        branch = branches[branch_name]
-        from_bus = branch['from_bus']
-        to_bus = branch['to_bus']
-
-        tau = 1.0
-        shift = 0.0
-        if branch['branch_type'] == 'transformer':
-            tau = branch['transformer_tap_ratio']
-            shift = math.radians(branch['transformer_phase_shift'])
-        _g = calculate_conductance(branch)
-        g = _g/tau
-        g2 = _g/tau**2
-
-        if base_point == BasePointType.FLATSTART:
-            vn = 1.
-            vm = 1.
-            tn = 0.
-            tm = 0.
-        elif base_point == BasePointType.SOLUTION: # TODO: check that we are loading the correct values (or results)
-            vn = buses[from_bus]['vm']
-            vm = buses[to_bus]['vm']
-            tn = buses[from_bus]['va']
-            tm = buses[to_bus]['va']
-
-        pfl_constant[idx_row] = g2 * (vn ** 2) + _g * (vm ** 2) \
-                              - 2 * g * vn * vm * (sin(tn - tm + shift) * (tn - tm) + cos(tn - tm + shift))
+    pfl_constant = g2 * (vn ** 2) + _g * (vm ** 2) \
+                   - 2 * g * vn * vm * (np.sin(tn - tm + shift) * (tn - tm) + np.cos(tn - tm + shift))
 
     return pfl_constant
 
@@ -601,19 +583,18 @@ def calculate_ptdf(branches,buses,index_set_branch,index_set_bus,reference_bus,b
         SENSI = SENSI[:-1,:-1]
         PTDF = np.matmul(J.A,SENSI)
     elif len(sparse_index_set_branch) < _len_branch:
-        B = np.array([], dtype=np.int64).reshape(_len_bus + 1,0)
+        sparse_index_set_branch = set(sparse_index_set_branch)
         _sparse_mapping_branch = {i: branch_n for i, branch_n in enumerate(index_set_branch) if branch_n in sparse_index_set_branch}
 
         ## TODO: Maybe just keep the sparse PTDFs as a dict of ndarrays?
         ## Right now the return type depends on the options 
         ## passed in
-        for idx, branch_name in _sparse_mapping_branch.items():
-            b = np.zeros((_len_branch,1))
-            b[idx] = 1
-            _tmp = np.matmul(J.transpose(),b)
-            _tmp = np.vstack([_tmp,0])
-            B = np.concatenate((B,_tmp), axis=1)
         row_idx = list(_sparse_mapping_branch.keys())
+        ## the columns of B are the rows of J for the requested branches,
+        ## with a trailing zero for the reference bus; build B once
+        ## rather than growing it one column at a time
+        B = np.zeros((_len_bus + 1, len(row_idx)))
+        B[:-1,:] = J[row_idx].T.toarray()
         PTDF = sp.sparse.lil_matrix((_len_branch,_len_bus))
         _ptdf = sp.sparse.linalg.spsolve(J0.transpose().tocsr(), B).T
         PTDF[row_idx] = _ptdf[:,:-1]
@@ -688,29 +669,25 @@ def calculate_ptdf_ldf(branches,buses,index_set_branch,index_set_bus,reference_b
         PTDF = np.matmul(J.A, SENSI)
         LDF = np.matmul(L.A, SENSI)
     elif len(sparse_index_set_branch) < _len_branch:
-        B_J = np.array([], dtype=np.int64).reshape(_len_bus + 1, 0)
-        B_L = np.array([], dtype=np.int64).reshape(_len_bus + 1, 0)
+        sparse_index_set_branch = set(sparse_index_set_branch)
         _sparse_mapping_branch = {i: branch_n for i, branch_n in enumerate(index_set_branch) if branch_n in sparse_index_set_branch}
 
-        for idx, branch_name in _sparse_mapping_branch.items():
-            b = np.zeros((_len_branch, 1))
-            b[idx] = 1
-
-            _tmp_J = np.matmul(J.transpose(), b)
-            _tmp_J = np.vstack([_tmp_J, 0])
-            B_J = np.concatenate((B_J, _tmp_J), axis=1)
+        row_idx = list(_sparse_mapping_branch.keys())
+        ## the columns of B_J (B_L) are the rows of J (L) for the requested
+        ## branches, with a trailing zero for the reference bus; build them
+        ## once rather than growing them one column at a time
+        B_J = np.zeros((_len_bus + 1, len(row_idx)))
+        B_J[:-1,:] = J[row_idx].T.toarray()
 
-            _tmp_L = np.matmul(L.transpose(), b)
-            _tmp_L = np.vstack([_tmp_L, 0])
-            B_L = np.concatenate((B_L, _tmp_L), axis=1)
+        B_L = np.zeros((_len_bus + 1, len(row_idx)))
+        B_L[:-1,:] = L[row_idx].T.toarray()
 
-        row_idx = list(_sparse_mapping_branch.keys())
         PTDF = sp.sparse.lil_matrix((_len_branch, _len_bus))
         _ptdf = sp.sparse.linalg.spsolve(J0.transpose().tocsr(), B_J).T
         PTDF[row_idx] = _ptdf[:, :-1]
 
         LDF = sp.sparse.lil_matrix((_len_branch, _len_bus))
-        _ldf = sp.sparselinalg.spsolve(J0.transpose().tocsr(), B_L).T
+        _ldf = sp.sparse.linalg.spsolve(J0.transpose().tocsr(), B_L).T
         LDF[row_idx] = _ldf[:, :-1]
 
     M1 = A@Jc
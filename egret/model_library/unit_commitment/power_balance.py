@@ -77,6 +77,20 @@ def _copperplate_approx_network_model(block,tm):
                                    bus_gs_fixed_shunts=bus_gs_fixed_shunts,
                                    )
 
+def _split_lines_by_service(m, tm):
+    '''
+    returns tuples of the in-service and out-of-service
+    lines at time tm, in a single pass over the outage status
+    '''
+    in_service = list()
+    out_service = list()
+    for l in m.TransmissionLines:
+        if value(m.LineOutOfService[l,tm]):
+            out_service.append(l)
+        else:
+            in_service.append(l)
+    return tuple(in_service), tuple(out_service)
+
 def _ptdf_dcopf_network_model(block,tm):
     m = block.model()
 
@@ -84,11 +98,10 @@ def _ptdf_dcopf_network_model(block,tm):
     branches = m._branches
     ptdf_options = m._ptdf_options
 
-    branches_in_service = tuple(l for l in m.TransmissionLines if not value(m.LineOutOfService[l,tm]))
-    ## this will serve as a key into our dict of PTDF matricies,
-    ## so that we can avoid recalculating them each time step
+    ## branches_out_service will serve as a key into our dict of PTDF
+    ## matricies, so that we can avoid recalculating them each time step
     ## with the same network topology
-    branches_out_service = tuple(l for l in m.TransmissionLines if value(m.LineOutOfService[l,tm]))
+    branches_in_service, branches_out_service = _split_lines_by_service(m, tm)
 
     gens_by_bus = block.gens_by_bus
 
@@ -132,7 +145,7 @@ def _ptdf_dcopf_network_model(block,tm):
 
         reference_bus = value(m.ReferenceBus)
 
-        PTDF = data_utils.get_ptdf_potentially_from_file(ptdf_options, branches_in_service, buses_idx)
+        PTDF = data_utils.get_ptdf_from_pickle(m._PTDF_pickle, branches_in_service, buses_idx)
         
         ## NOTE: For now, just use a flat-start for unit commitment
         if PTDF is None:
@@ -185,11 +198,7 @@ def _btheta_dcopf_network_model(block,tm):
     buses = m._buses
     branches = m._branches
 
-    branches_in_service = tuple(l for l in m.TransmissionLines if not value(m.LineOutOfService[l,tm]))
-    ## this will serve as a key into our dict of PTDF matricies,
-    ## so that we can avoid recalculating them each time step
-    ## with the same network topology
-    branches_out_service = tuple(l for l in m.TransmissionLines if value(m.LineOutOfService[l,tm]))
+    branches_in_service, branches_out_service = _split_lines_by_service(m, tm)
 
     ## need the inlet/outlet relationship given some lines may be out
     inlet_branches_by_bus = dict()
@@ -522,6 +531,9 @@ def copperplate_relaxed_power_flow(model, slacks=True):
                                             })
 def ptdf_power_flow(model, slacks=True):
     model._PTDFs = dict()
+    ## unpickle any PTDF matrices once for the whole model,
+    ## rather than once per time period with new topology
+    model._PTDF_pickle = data_utils.load_ptdf_pickle_potentially(model._ptdf_options)
     _add_egret_power_flow(model, _ptdf_dcopf_network_model, reactive_power=False, slacks=slacks)
 
 @add_model_attr(component_name, requires = {'data_loader': None,
@@ -17,6 +17,7 @@ the create_ptdf_losses_dcopf_model are not equivalent; the former is a QCP and t
 
 """
 import pyomo.environ as pe
+import numpy as np
 import egret.model_library.transmission.tx_utils as tx_utils
 import egret.model_library.transmission.tx_calc as tx_calc
 import egret.model_library.transmission.bus as libbus
@@ -186,10 +187,7 @@ def create_btheta_losses_dcopf_model(model_data, relaxation_type=RelaxationType.
 
 
 def create_ptdf_losses_dcopf_model(model_data, include_feasibility_slack=False, ptdf_options=None):
-    if ptdf_options is None:
-        ptdf_options = dict()
-
-    lpu.populate_default_ptdf_options(ptdf_options)
+    ptdf_options = lpu.populate_default_ptdf_options(ptdf_options)
 
     baseMVA = model_data.data['system']['baseMVA']
     lpu.check_and_scale_ptdf_options(ptdf_options, baseMVA)
@@ -253,10 +251,19 @@ def create_ptdf_losses_dcopf_model(model_data, include_feasibility_slack=False,
     ## We'll assume we have a solution to initialize from
     base_point = BasePointType.SOLUTION
 
-    PTDF = data_utils.PTDFLossesMatrix(branches, buses, reference_bus, base_point)
+    ## to keep things in order
+    buses_idx = tuple(buses.keys())
+    branches_idx = tuple(branches.keys())
+
+    PTDF = data_utils.get_ptdf_potentially_from_file(ptdf_options, branches_idx, buses_idx)
+    ## a lossless PTDFMatrix may have been saved for the same network
+    if not isinstance(PTDF, data_utils.PTDFLossesMatrix):
+        PTDF = data_utils.PTDFLossesMatrix(branches, buses, reference_bus, base_point, branches_keys=branches_idx, buses_keys=buses_idx)
     model._PTDF = PTDF
     model._ptdf_options = ptdf_options
 
+    data_utils.write_ptdf_potentially_to_file(ptdf_options, PTDF)
+
     libbranch.declare_expr_pf(model=model,
                              index_set=branch_attrs['names'],
                              )
@@ -390,16 +397,18 @@ def solve_dcopf_losses(model_data,
         buses_idx = PTDF.buses_keys
         branches_idx = PTDF.branches_keys
 
+        ## calculate the LMPs using numpy, rather than
+        ## looping over every (bus, branch) pair
+        PFD = np.fromiter((value(m.dual[m.ineq_pf_branch_thermal_lb[k]]) + value(m.dual[m.ineq_pf_branch_thermal_ub[k]])
+                            for k in branches_idx), float, count=len(branches_idx))
+        PFLD = np.fromiter((value(m.dual[m.eq_pfl_branch[k]]) for k in branches_idx), float, count=len(branches_idx))
+        LMP = value(m.dual[m.eq_p_balance]) + ptdf_r.T.dot(PFD) + ldf.T.dot(PFLD)
+
         for j, b in enumerate(buses_idx):
             b_dict = buses[b]
             b_dict['pl'] = value(m.pl[b])
             b_dict.pop('qlmp',None)
-
-            b_dict['lmp'] = value(m.dual[m.eq_p_balance])
-            for i, k in enumerate(branches_idx):
-                b_dict['lmp'] += ptdf_r[i,j]*value(m.dual[m.ineq_pf_branch_thermal_lb[k]])
-                b_dict['lmp'] += ptdf_r[i,j]*value(m.dual[m.ineq_pf_branch_thermal_ub[k]])
-                b_dict['lmp'] += ldf[i,j]*value(m.dual[m.eq_pfl_branch[k]])
+            b_dict['lmp'] = LMP[j]
 
     else:
         raise Exception("Unrecognized dcopf_losses_model_generator {}".format(dcopf_losses_model_generator))
@@ -71,6 +71,19 @@ class TestDCOPF(unittest.TestCase):
         comparison = math.isclose(md.data['system']['total_cost'], md_soln.data['system']['total_cost'], rel_tol=1e-6)
         self.assertTrue(comparison)
 
+    @parameterized.expand(zip(test_cases))
+    def test_ptdf_options_unchanged(self, test_case):
+        md_dict = create_ModelData(test_case)
+        baseMVA = md_dict.data['system']['baseMVA']
+
+        ## building twice from the same options should
+        ## neither modify them nor scale them twice
+        ptdf_options = {'abs_flow_tol': 1.}
+        for _ in range(2):
+            model, md = create_ptdf_dcopf_model(md_dict, ptdf_options=ptdf_options)
+            self.assertEqual(ptdf_options, {'abs_flow_tol': 1.})
+            self.assertAlmostEqual(model._ptdf_options['abs_flow_tol'], 1./baseMVA)
+
     @parameterized.expand(zip(test_cases, soln_cases))
     def test_ptdf_serialization_deserialization(self, test_case, soln_case):
         dcopf_model = create_ptdf_dcopf_model
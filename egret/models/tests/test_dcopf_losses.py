@@ -75,5 +75,27 @@ class TestBThetaDCOPF(unittest.TestCase):
         comparison = math.isclose(md.data['system']['total_cost'], md_soln.data['system']['total_cost'], rel_tol=1e-6)
         self.assertTrue(comparison)
 
+    @parameterized.expand(zip(test_cases, ptdf_soln_cases))
+    def test_ptdf_losses_serialization_deserialization(self, test_case, soln_case):
+        dcopf_losses_model = create_ptdf_losses_dcopf_model
+
+        md_dict = create_ModelData(test_case)
+
+        from egret.models.acopf import solve_acopf
+        md_dict, _, _ = solve_acopf(md_dict, "ipopt", solver_tee=False, return_model=True, return_results=True)
+
+        kwargs = {'ptdf_options': {'save_to': test_case+'.losses.pickle'}}
+        md_serialization, results = solve_dcopf_losses(md_dict, "ipopt", dcopf_losses_model_generator=dcopf_losses_model, solver_tee=False, return_results=True, **kwargs)
+        self.assertTrue(results.solver.termination_condition == TerminationCondition.optimal)
+
+        self.assertTrue(os.path.isfile(test_case+'.losses.pickle'))
+
+        kwargs = {'ptdf_options': {'load_from': test_case+'.losses.pickle'}}
+        md_deserialization, results = solve_dcopf_losses(md_dict, "ipopt", dcopf_losses_model_generator=dcopf_losses_model, solver_tee=False, return_results=True, **kwargs)
+        self.assertTrue(results.solver.termination_condition == TerminationCondition.optimal)
+
+        comparison = math.isclose(md_serialization.data['system']['total_cost'], md_deserialization.data['system']['total_cost'], rel_tol=1e-6)
+        self.assertTrue(comparison)
+
 if __name__ == '__main__':
      unittest.main()
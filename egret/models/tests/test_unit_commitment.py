@@ -179,6 +179,21 @@ def test_uc_ptdf_termination():
 
     assert results.egret_metasolver['iterations'] == 1
 
+def test_uc_ptdf_options_unchanged():
+    test_name = 'tiny_uc_tc'
+    input_json_file_name = os.path.join(current_dir, 'uc_test_instances', test_name+'.json')
+
+    md_in = ModelData(json.load(open(input_json_file_name, 'r')))
+
+    ## building the model fills in defaults and scales the
+    ## tolerances, but should leave the caller's dictionary alone
+    ptdf_options = {'lazy': True, 'abs_flow_tol': 1.}
+    uc_model = _make_get_dcopf_uc_model('ptdf_power_flow')
+    model = uc_model(md_in, ptdf_options=ptdf_options)
+
+    assert ptdf_options == {'lazy': True, 'abs_flow_tol': 1.}
+    assert model._ptdf_options['abs_flow_tol'] == 1./md_in.data['system']['baseMVA']
+
 def test_uc_ptdf_serialization_deserialization():
 
     test_name = 'tiny_uc_tc' ## based on tiny_uc_1
@@ -805,6 +805,25 @@ def solve_unit_commitment(model_data,
     if hasattr(m, 'fuel_consumption'):
         fc = True
 
+    ## all of the potential constraints that could limit maximum output
+    ## Not all unit commitment models have these constraints, so first
+    ## we need check if they're on the model object; this is the same
+    ## for every generator, so only do it once
+    ramp_up_avail_potential_constrs = [
+                                      'EnforceMaxAvailableRampUpRates',
+                                      'AncillaryServiceRampUpLimit',
+                                      'power_limit_from_start',
+                                      'power_limit_from_stop',
+                                      'power_limit_from_start_stop',
+                                      'power_limit_from_start_stops',
+                                      'EnforceMaxAvailableRampDownRates',
+                                      'EnforceMaxCapacity',
+                                     ]
+    ramp_up_avail_constrs = []
+    for constr in ramp_up_avail_potential_constrs:
+        if hasattr(m, constr):
+            ramp_up_avail_constrs.append(getattr(m, constr))
+
     for g,g_dict in thermal_gens.items():
         pg_dict = {}
         if reserve_requirement:
@@ -814,24 +833,6 @@ def solve_unit_commitment(model_data,
         production_cost_dict = {}
         ramp_up_avail_dict = {}
 
-        ## all of the potential constraints that could limit maximum output
-        ## Not all unit commitment models have these constraints, so first
-        ## we need check if they're on the model object
-        ramp_up_avail_potential_constrs = [
-                                          'EnforceMaxAvailableRampUpRates',
-                                          'AncillaryServiceRampUpLimit',
-                                          'power_limit_from_start',
-                                          'power_limit_from_stop',
-                                          'power_limit_from_start_stop',
-                                          'power_limit_from_start_stops',
-                                          'EnforceMaxAvailableRampDownRates',
-                                          'EnforceMaxCapacity',
-                                         ]
-        ramp_up_avail_constrs = []
-        for constr in ramp_up_avail_potential_constrs:
-            if hasattr(m, constr):
-                ramp_up_avail_constrs.append(getattr(m, constr))
-
         if regulation:
             reg_prov = {}
             reg_up_supp = {}
@@ -848,7 +849,8 @@ def solve_unit_commitment(model_data,
         gfs = (fs and (g in m.FuelSupplyGenerators))
         if gfs:
             fuel_consumed = {}
-        gdf = (fc and (g in m.DualFuelGenerators))
+        dual_fuel = (g in m.DualFuelGenerators)
+        gdf = (fc and dual_fuel)
         if gdf:
             aux_fuel_consumed = {}
         gdsf = (gdf and (g in m.SingleFireDualFuelGenerators))
@@ -862,7 +864,7 @@ def solve_unit_commitment(model_data,
                 rg_dict[dt] = value(m.ReserveProvided[g,mt])
             commitment_dict[dt] = value(m.UnitOn[g,mt])
             commitment_cost_dict[dt] = value(m.ShutdownCost[g,mt])
-            if g in m.DualFuelGenerators:
+            if dual_fuel:
                 commitment_cost_dict[dt] += value(m.DualFuelCommitmentCost[g,mt])
                 production_cost_dict[dt] = value(m.DualFuelProductionCost[g,mt])
             else:
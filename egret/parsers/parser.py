@@ -176,20 +176,26 @@ def convert_load_by_area_to_source(data_dir, begin_time, end_time, t0_state=None
         new_load_time_series_df.to_csv(os.path.join(data_dir, 'timeseries_data_files', 'Load', new_load_time_series_fname), index=False)
 
         # Augment time series pointer dataframe.
+        # Collect the new rows first and concatenate once; appending row
+        # by row copies the whole dataframe for every load.
+        new_load_timeseries_specs = []
         for name, load in md_obj.elements('load'):
             new_load_timeseries_spec = {}
             new_load_timeseries_spec['Object'] = name
             new_load_timeseries_spec['Parameter'] = 'Requirement'
             new_load_timeseries_spec['Simulation'] = 'DAY_AHEAD'
             new_load_timeseries_spec['Data File'] = day_ahead_load_file
-            timeseries_pointer_df = timeseries_pointer_df.append(new_load_timeseries_spec, ignore_index=True)
+            new_load_timeseries_specs.append(new_load_timeseries_spec)
 
             new_load_timeseries_spec = {}
             new_load_timeseries_spec['Object'] = name
             new_load_timeseries_spec['Parameter'] = 'Requirement'
             new_load_timeseries_spec['Simulation'] = 'REAL_TIME'
             new_load_timeseries_spec['Data File'] = real_time_load_file
-            timeseries_pointer_df = timeseries_pointer_df.append(new_load_timeseries_spec, ignore_index=True)
+            new_load_timeseries_specs.append(new_load_timeseries_spec)
+
+        timeseries_pointer_df = pd.concat([timeseries_pointer_df, pd.DataFrame(new_load_timeseries_specs)],
+                                          ignore_index=True, sort=False)
         
         timeseries_pointer_df.loc[timeseries_pointer_df['Object'] != 'Load'].to_csv(os.path.join(data_dir, 'SourceData', 'timeseries_pointers.csv'), index=False)
 
@@ -325,6 +331,19 @@ def create_model_data_dict(rts_gmlc_dir, begin_time, end_time, simulation="DAY_A
     
         timeseries_pointer_dict[(new_timeseries_pointer.Object, new_timeseries_pointer.Simulation)] = new_timeseries_pointer
 
+    ## many renewable generators share a time series file, so group
+    ## them by file and read each file once, for just the time and
+    ## those generators' columns
+    renewables_by_data_file = {}
+    for name, gen in md_obj.elements("generator", generator_type="renewable"):
+        if gen["fuel"] in ["Solar", "Wind", "Hydro"] and (name, simulation) in timeseries_pointer_dict:
+            data_file = timeseries_pointer_dict[(name,simulation)].DataFile
+            renewables_by_data_file.setdefault(data_file, []).append(name)
+
+    renewables_timeseries_dfs = { data_file : _read_rts_gmlc_table(data_file, simulation,
+                                                                   usecols=['Year', 'Month', 'Day', 'Period']+names)
+                                  for data_file, names in renewables_by_data_file.items() }
+
     filtered_timeseries = {}
     for name, gen in md_obj.elements("generator", generator_type="renewable"):
         if gen["fuel"] in ["Solar", "Wind", "Hydro"]:
@@ -333,7 +352,7 @@ def create_model_data_dict(rts_gmlc_dir, begin_time, end_time, simulation="DAY_A
                 
             else:
                 #print("Time series for generator=%s will be loaded from file=%s" % (name, timeseries_pointer_dict[(name,"DAY_AHEAD")].DataFile))
-                renewables_timeseries_df = _read_rts_gmlc_table(timeseries_pointer_dict[(name,simulation)].DataFile, simulation)
+                renewables_timeseries_df = renewables_timeseries_dfs[timeseries_pointer_dict[(name,simulation)].DataFile]
                 this_source_timeseries_df = renewables_timeseries_df.loc[:,["Year_Month_Day_Period", name]]
                 this_source_timeseries_df = this_source_timeseries_df.rename(columns = {"Year_Month_Day_Period" : "DateTime"})
 
@@ -796,7 +815,7 @@ def _create_rtsgmlc_skeleton(rts_gmlc_dir):
 
     return model_data
 
-def _read_rts_gmlc_table(file_name, simulation):
+def _read_rts_gmlc_table(file_name, simulation, usecols=None):
     if simulation == "DAY_AHEAD":
         _date_parser = lambda *columns: datetime(*map(int,columns[0:3]), int(columns[3])-1)
     else:
@@ -809,6 +828,7 @@ def _read_rts_gmlc_table(file_name, simulation):
     return pd.read_csv(file_name, 
                          header=0, 
                          sep=',', 
+                         usecols=usecols,
                          parse_dates=[[0, 1, 2, 3]],
                          date_parser=_date_parser)
 
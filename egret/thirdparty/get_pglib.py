@@ -69,7 +69,7 @@ def get_pglib(download_dir=None):
         downloader.set_destination_filename(zipfile_dest)
         logger.info('... downloading from: {}'.format(_pglib_zip_url))
         downloader.get_binary_file(_pglib_zip_url)
-    except:
+    except Exception:
         logger.error("***\nFailed to download: {}\n***".format(_pglib_zip_url))
         raise
 
@@ -78,7 +78,7 @@ def get_pglib(download_dir=None):
     try:
         zf = ZipFile(zipfile_dest, 'r')
         zf.extractall(download_dir, files)
-    except:
+    except Exception:
         logger.error("***\nFailed to extract files from {}\n***".format(zipfile_dest))
         raise
 
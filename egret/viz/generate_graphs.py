@@ -1,6 +1,7 @@
 import os
 from collections import namedtuple, defaultdict
 import datetime
+import functools
 import textwrap
 
 import matplotlib as mpl
@@ -13,15 +14,29 @@ import seaborn as sns
 import numpy as np
 
 # Seaborn/matplotlib plot settings
-sns.set()
-sns.set_context('paper', font_scale=2.00)
-
-
 font = {'family' : 'sans-serif',
         'weight' : 'regular',
         'size'   : 14
         }
-mpl.rc('font', **font)
+
+
+def _plot_rc_params():
+    """Returns the rcParams used for EGRET plots: seaborn's default theme in the 'paper' context, with the font above."""
+    rc = dict()
+    rc.update(sns.axes_style('darkgrid'))
+    rc.update(sns.plotting_context('paper', font_scale=2.00))
+    rc['axes.prop_cycle'] = mpl.cycler(color=sns.color_palette('deep'))
+    rc.update({'font.'+k : v for k, v in font.items()})
+    return rc
+
+
+def _with_plot_rc_params(plot_func):
+    """Applies the EGRET plot settings while plot_func builds its figure, rather than changing them globally on import."""
+    @functools.wraps(plot_func)
+    def wrapper(*args, **kwargs):
+        with mpl.rc_context(_plot_rc_params()):
+            return plot_func(*args, **kwargs)
+    return wrapper
 
 
 GenerationType = namedtuple('GenerationType',
@@ -101,6 +116,12 @@ def _fuel_type_to_code(x):
     
     return code
 
+def _generation_type(x):
+    """Returns the GenerationType for a generation type code or fuel type string."""
+    if x in GENERATION_TYPES:
+        return GENERATION_TYPES[x]
+    return GENERATION_TYPES[FUEL_TO_CODE[x]]
+
 def _build_attribute_to_array_func(time_indices):
     '''returns a function for converting EGRET time-valued objects to np arrays'''
     def attribute_to_array(attr):
@@ -111,6 +132,7 @@ def _build_attribute_to_array_func(time_indices):
             return np.array([attr for t in time_indices])
     return attribute_to_array
 
+@_with_plot_rc_params
 def generate_stack_graph(egret_model_data, bar_width=0.9, 
                             x_tick_frequency=1,
                             title='', 
@@ -140,23 +162,24 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
     time_periods = egret_model_data.data['system']['time_indices']
     attribute_to_array = _build_attribute_to_array_func(time_periods)
 
+    ## check the options before creating the figure, so
+    ## a bad call doesn't leave an open figure behind
+    if plot_individual_generators and show_individual_components:
+        raise ValueError('plot_individual_generators and show_individual_components cannot be simultaneously True.')
+
+    INDIVIDUAL_GEN_PLOT_UPPER_LIMIT = 5
+
+    if plot_individual_generators and len(egret_model_data.data['elements']['generator']) > INDIVIDUAL_GEN_PLOT_UPPER_LIMIT:
+        raise ValueError('There are too many generators in the system to support plotting output individually. (maximum: {0})'.format(INDIVIDUAL_GEN_PLOT_UPPER_LIMIT))
+
     def _plot_generation_stack_components():
-        if plot_individual_generators and show_individual_components:
-            raise ValueError('plot_individual_generators and show_individual_components cannot be simultaneously True.')
-            return
-        
         bottom = np.zeros(len(indices))
         
         if plot_individual_generators:      
-            INDIVIDUAL_GEN_PLOT_UPPER_LIMIT = 5
-
-            if len(egret_model_data.data['elements']['generator']) > INDIVIDUAL_GEN_PLOT_UPPER_LIMIT:
-                raise ValueError('There are too many generators in the system to support plotting output individually. (maximum: {0})'.format(INDIVIDUAL_GEN_PLOT_UPPER_LIMIT))
-
             for generator, generator_data in egret_model_data.data['elements']['generator'].items():
                 pg_array = attribute_to_array(generator_data['pg'])
 
-                if not sum(pg_array) > 0.0:
+                if not pg_array.sum() > 0.0:
                     continue
 
                 is_quickstart = generator_data.get('quickstart_capable', False)
@@ -182,7 +205,7 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
             for generator, generator_data in egret_model_data.data['elements']['generator'].items():
                 pg_array = attribute_to_array(generator_data['pg'])
 
-                if not sum(pg_array) > 0.0:
+                if not pg_array.sum() > 0.0:
                     continue
 
                 reported_fuel_type = generator_data['fuel']
@@ -197,24 +220,12 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
                 else:
                     quickstart_label = 'not quickstart'
         
-                try:
-                    generator_generation_by_fuel_type[fuel_type].append((pg_array, quickstart_label))
-                except KeyError:
-                    generator_generation_by_fuel_type[fuel_type] = []
-                    generator_generation_by_fuel_type[fuel_type].append((pg_array, quickstart_label))
+                generator_generation_by_fuel_type.setdefault(fuel_type, []).append((pg_array, quickstart_label))
             
             sorted_total_generation_by_fuel_type = sorted(generator_generation_by_fuel_type.items(), key=lambda x: GENERATION_TYPE_SORT_KEY.get(x[0], 1e3))
 
             for generation_type, generator_output_levels in sorted_total_generation_by_fuel_type:
-                try:
-                    component_label = GENERATION_TYPES[generation_type].label
-                except KeyError:
-                    component_label = GENERATION_TYPES[FUEL_TO_CODE[generation_type]].label
-                
-                try:
-                    component_color = GENERATION_TYPES[generation_type].color
-                except KeyError:
-                    component_color = GENERATION_TYPES[FUEL_TO_CODE[generation_type]].color
+                component_label, component_color = _generation_type(generation_type)
 
                 if len(generator_output_levels) < 1:
                     continue
@@ -249,7 +260,7 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
             for generator, generator_data in egret_model_data.data['elements']['generator'].items():
                 pg_array = attribute_to_array(generator_data['pg'])
 
-                if not sum(pg_array) > 0.0:
+                if not pg_array.sum() > 0.0:
                     continue
     
                 reported_fuel_type = generator_data['fuel']
@@ -264,42 +275,28 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
                 else:
                     quickstart_label = 'not quickstart'
         
-                try:
-                    total_generation_by_fuel_type[fuel_type][quickstart_label] += pg_array
-                except KeyError:
-                    total_generation_by_fuel_type[fuel_type] = {}
-                    total_generation_by_fuel_type[fuel_type][quickstart_label] = pg_array
+                generation_by_quickstart = total_generation_by_fuel_type.setdefault(fuel_type, {})
+                if quickstart_label in generation_by_quickstart:
+                    generation_by_quickstart[quickstart_label] += pg_array
+                else:
+                    generation_by_quickstart[quickstart_label] = pg_array
 
             # Plot each bar stack component.
             sorted_total_generation_by_fuel_type = sorted(total_generation_by_fuel_type.items(), key=lambda x: GENERATION_TYPE_SORT_KEY.get(x[0], 1e3))
 
             for generation_type, total_generation_array in sorted_total_generation_by_fuel_type:
-                try:
-                    component_label = GENERATION_TYPES[generation_type].label
-                except KeyError:
-                    component_label = GENERATION_TYPES[FUEL_TO_CODE[generation_type]].label
-                
-                try:
-                    component_color = GENERATION_TYPES[generation_type].color
-                except KeyError:
-                    component_color = GENERATION_TYPES[FUEL_TO_CODE[generation_type]].color
+                component_label, component_color = _generation_type(generation_type)
 
                 # Non-quickstart.
-                try:
-                    component_values = total_generation_array['not quickstart']
-                except KeyError:
-                    pass
-                else:
+                component_values = total_generation_array.get('not quickstart')
+                if component_values is not None:
                     ax.bar(indices, component_values, bar_width, bottom=bottom, color=component_color, label=component_label,
                         linewidth=0)
                     bottom += component_values
 
                 # Quickstart.
-                try:
-                    component_values = total_generation_array['quickstart']
-                except KeyError:
-                    pass
-                else:
+                component_values = total_generation_array.get('quickstart')
+                if component_values is not None:
                     ax.bar(indices, component_values, bar_width, bottom=bottom, color=component_color, label=component_label,
                         hatch='//',
                         linewidth=0)
@@ -326,7 +323,7 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
 
         total_load_shed_by_hour += load_shed
     
-    if sum(total_load_shed_by_hour) > 0.0:
+    if total_load_shed_by_hour.sum() > 0.0:
         component_color = '#ffff00'
         ax.bar(indices, total_load_shed_by_hour, bar_width, bottom=bottom, color=component_color, 
                edgecolor=None, linewidth=0,                
@@ -353,7 +350,7 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
     if reserve_requirements_by_hour is not None:
         reserve_requirements_array = attribute_to_array(reserve_requirements_by_hour)
 
-        if sum(reserve_requirements_array) > 0.0:
+        if reserve_requirements_array.sum() > 0.0:
             component_color = '#00c2ff'
             ax.bar(indices, reserve_requirements_array, bar_width, bottom=bottom, color=component_color,
                    edgecolor=None, linewidth=0,
@@ -364,7 +361,7 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
         reserve_shortfall_by_hour = egret_model_data.data['system']['reserve_shortfall']
         reserve_shortfall_array = attribute_to_array(reserve_shortfall_by_hour)
     
-        if sum(reserve_shortfall_array) > 0.0:
+        if reserve_shortfall_array.sum() > 0.0:
             component_color = '#ff00ff'
             ax.bar(indices, reserve_shortfall_array, bar_width, bottom=bottom, color=component_color,
                    edgecolor=None, linewidth=0,
@@ -383,18 +380,18 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
 
             if is_quickstart:
                 commitment = attribute_to_array(gen_data['commitment'])
-                reserves_available = [headroom[ix] if commit_status > 0.0 else 0 for ix, commit_status in enumerate(commitment)]
+                reserves_available = np.where(commitment > 0.0, headroom, 0.)
             else:
                 reserves_available = headroom
 
             reserves_by_hour += reserves_available
     
     if reserve_requirements_by_hour is not None:
-        implicit_reserves_by_hour = [max(0.0, reserves_by_hour[ix] - reserves_by_hour[ix]) for ix in range(len(reserve_requirements_by_hour))]
+        implicit_reserves_by_hour = np.maximum(0.0, reserves_by_hour - reserve_requirements_array)
     else:
-        implicit_reserves_by_hour = [max(0.0, reserves_by_hour[ix]) for ix in range(len(reserves_by_hour))]
+        implicit_reserves_by_hour = np.maximum(0.0, reserves_by_hour)
     
-    if sum(implicit_reserves_by_hour) > 0.0:
+    if implicit_reserves_by_hour.sum() > 0.0:
         component_color = '#00ffc7'
         ax.bar(indices, implicit_reserves_by_hour, bar_width, bottom=bottom, color=component_color, 
                edgecolor=None, linewidth=0, 
@@ -413,11 +410,11 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
             startup_capacity = gen_data['startup_capacity']
             quickstart_capacity = min(p_max, startup_capacity)
 
-            quickstart_capacity_available = [quickstart_capacity if commit_status > 0.0 else 0 for ix, commit_status in enumerate(commitment)]
+            quickstart_capacity_available = np.where(commitment > 0.0, quickstart_capacity, 0.)
 
             total_quickstart_capacity_by_hour += quickstart_capacity_available
     
-    if sum(total_quickstart_capacity_by_hour) > 0.0:
+    if total_quickstart_capacity_by_hour.sum() > 0.0:
         component_color = '#494949'
         ax.bar(indices, total_quickstart_capacity_by_hour, bar_width, bottom=bottom, color=component_color, 
                edgecolor=None, linewidth=0, 
@@ -439,7 +436,7 @@ def generate_stack_graph(egret_model_data, bar_width=0.9,
 
             total_renewable_curtailment_by_hour += p_curtailed
     
-    if sum(total_renewable_curtailment_by_hour) > 0.0:
+    if total_renewable_curtailment_by_hour.sum() > 0.0:
         component_color = '#ff0000'
         ax.bar(indices, total_renewable_curtailment_by_hour, bar_width, bottom=bottom, color=component_color, 
                edgecolor=None, linewidth=0, 
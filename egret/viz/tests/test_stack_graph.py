@@ -10,6 +10,8 @@ except (ImportError, ModuleNotFoundError):
 else:
     viz_packages_installed = True
 
+    import numpy as np
+    import matplotlib.pyplot as plt
     from egret.viz.generate_graphs import generate_stack_graph
     from egret.data.model_data import ModelData
     from egret.models.unit_commitment import solve_unit_commitment, create_tight_unit_commitment_model
@@ -48,6 +50,7 @@ class TestStackGraphWithUCTestInstances(unittest.TestCase):
                 show_individual_components=False,
                 plot_individual_generators=False,
             )
+            plt.close(fig)
     
     def test_individual_component_stack_graph(self):
         """Tests stack graph generation when breaking out individual components per generation type."""
@@ -76,6 +79,7 @@ class TestStackGraphWithUCTestInstances(unittest.TestCase):
                 show_individual_components=True,
                 plot_individual_generators=False,
             )
+            plt.close(fig)
     
     def test_individual_generator_stack_graph(self):
         """Tests stack graph generation when plotting individual generators."""
@@ -138,5 +142,39 @@ class TestStackGraphWithUCTestInstances(unittest.TestCase):
                 )
 
 
+    def test_implicit_reserve_stack_graph(self):
+        """Tests that implicit reserves are the thermal headroom in excess of the reserve requirement."""
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        test_case = os.path.join(current_dir, '..', '..', 'models', 'tests', 'uc_test_instances', 'tiny_uc_6_results.json')
+
+        with open(test_case, 'r') as f:
+            md_dict = json.load(f)
+        solved_md = ModelData(md_dict)
+
+        time_indices = solved_md.data['system']['time_indices']
+        reserve_requirement = solved_md.data['system']['reserve_requirement']['values']
+
+        expected_implicit_reserves = []
+        for t in time_indices:
+            headroom = 0.
+            for _, gen_data in solved_md.elements(element_type='generator', generator_type='thermal'):
+                if gen_data.get('quickstart_capable', False) and gen_data['commitment']['values'][t] <= 0.:
+                    continue
+                headroom += gen_data['headroom']['values'][t]
+            expected_implicit_reserves.append(max(0., headroom - reserve_requirement[t]))
+
+        fig, ax = generate_stack_graph(
+            solved_md,
+            title=repr(test_case),
+            show_individual_components=False,
+            plot_individual_generators=False,
+        )
+        implicit_reserve_bars = [container for container in ax.containers if container.get_label() == 'Implicit Reserve']
+        plt.close(fig)
+
+        self.assertEqual(len(implicit_reserve_bars), 1)
+        implicit_reserves = [bar.get_height() for bar in implicit_reserve_bars[0]]
+        self.assertTrue(np.allclose(implicit_reserves, expected_implicit_reserves))
+
 if __name__ == '__main__':
     unittest.main()